@@ -3,9 +3,199 @@
 Security verification script.
 Run this before committing code to ensure no sensitive data is exposed.
 """
+import mmap
 import os
 import re
+import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+
+# Patterns for hardcoded secrets, compiled once at import.
+# Each carries a literal that must appear (in any case) for the pattern to match.
+SECRET_PATTERNS = [
+    (r'mongodb\+srv://[^<][^"\']+', 'MongoDB connection string', b'mongodb+srv'),
+    (r'password\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded password', b'password'),
+    (r'api[_-]?key\s*=\s*["\'][^"\']+["\']', 'API key', b'api'),
+    (r'secret\s*=\s*["\'][^"\']+["\']', 'Secret key', b'secret'),
+]
+
+_COMPILED_PATTERNS = [
+    (re.compile(pattern.encode(), re.IGNORECASE), description)
+    for pattern, description, _ in SECRET_PATTERNS
+]
+
+# Caseless alternation of the required literals, searched directly on the
+# file mapping so the pre-filter needs no copy of the content
+_LITERAL_PREFILTER = re.compile(
+    b'|'.join(re.escape(literal) for _, _, literal in SECRET_PATTERNS),
+    re.IGNORECASE
+)
+
+
+def _build_hyperscan_db():
+    """Compile all secret patterns into a single Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    
+    count = len(SECRET_PATTERNS)
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[pattern.encode() for pattern, _, _ in SECRET_PATTERNS],
+        ids=list(range(count)),
+        elements=count,
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * count
+    )
+    return db
+
+
+_HYPERSCAN_DB = _build_hyperscan_db()
+
+# Hyperscan scratch space cannot be shared between concurrent scans
+_thread_local = threading.local()
+
+
+def _hyperscan_scratch():
+    """Get this thread's Hyperscan scratch space, allocating it on first use."""
+    scratch = getattr(_thread_local, 'scratch', None)
+    if scratch is None:
+        scratch = _thread_local.scratch = hyperscan.Scratch(_HYPERSCAN_DB)
+    return scratch
+
+# Directories never scanned for secrets
+SKIP_DIRS = {'venv', '.git', '__pycache__', '.ipynb_checkpoints'}
+
+# Files larger than this are generated or vendored, not hand-written config
+MAX_SCAN_BYTES = 2_000_000
+
+# Leading bytes checked for NUL to detect binary files
+BINARY_SNIFF_BYTES = 8192
+
+
+def _iter_python_files(start_dir: str = '.'):
+    """
+    Yield paths of Python files under start_dir, skipping SKIP_DIRS and
+    files larger than MAX_SCAN_BYTES.
+    
+    Uses os.scandir so file type checks come from the cached directory
+    entries rather than an extra stat call per file.
+    """
+    pending = deque([start_dir])
+    
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                dir_entries = list(entries)
+        except OSError as e:
+            # Unreadable or vanished directory: skip it like os.walk did
+            print(f"⚠️  Could not scan {directory}: {e}")
+            continue
+        
+        for entry in dir_entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    pending.append(entry.path)
+            elif entry.name.endswith('.py') and entry.is_file():
+                try:
+                    size = entry.stat().st_size
+                except OSError as e:
+                    print(f"⚠️  Could not scan {entry.path}: {e}")
+                    continue
+                
+                if size > MAX_SCAN_BYTES:
+                    print(f"⚠️  Skipped {entry.path}: larger than {MAX_SCAN_BYTES} bytes")
+                    continue
+                yield entry.path
+
+
+def _find_secrets(content):
+    """
+    Find secret pattern matches in file content (bytes or a memory map).
+    
+    Content without any of the required literals is skipped before the full
+    patterns run. Otherwise uses a single Hyperscan pass when available,
+    falling back to the pre-compiled regex patterns.
+    
+    Returns:
+        List of (match_start, description) tuples ordered by pattern, then offset
+    """
+    if not _LITERAL_PREFILTER.search(content):
+        return []
+    
+    if _HYPERSCAN_DB is None:
+        return [
+            (match.start(), description)
+            for regex, description in _COMPILED_PATTERNS
+            for match in regex.finditer(content)
+        ]
+    
+    # Hyperscan reports every end offset, so collapse matches by (pattern, start)
+    matches = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        matches.add((pattern_id, start))
+    
+    _HYPERSCAN_DB.scan(content, match_event_handler=on_match, scratch=_hyperscan_scratch())
+    return [(start, SECRET_PATTERNS[pattern_id][1]) for pattern_id, start in sorted(matches)]
+
+
+@lru_cache(maxsize=1)
+def _open_repo():
+    """Open the current git repository in-process with libgit2, if available."""
+    if pygit2 is None:
+        return None
+    
+    try:
+        return pygit2.Repository('.')
+    except (pygit2.GitError, KeyError):
+        return None
+
+
+def _is_tracked(path: str) -> bool:
+    """Check whether a path is tracked in the git index."""
+    repo = _open_repo()
+    if repo is not None:
+        return path in repo.index
+    
+    try:
+        result = subprocess.run(['git', 'ls-files', path], capture_output=True, text=True)
+    except OSError:
+        return False
+    return bool(result.stdout.strip())
+
+
+def _staged_files():
+    """List paths staged for commit (index compared to HEAD)."""
+    repo = _open_repo()
+    if repo is None:
+        result = subprocess.run(
+            ['git', 'diff', '--cached', '--name-only'],
+            capture_output=True,
+            text=True
+        )
+        return [file for file in result.stdout.strip().split('\n') if file]
+    
+    try:
+        head_tree = repo.revparse_single('HEAD').tree
+    except KeyError:
+        # No commits yet, so everything in the index is staged
+        return [entry.path for entry in repo.index]
+    
+    return [delta.new_file.path for delta in repo.index.diff_to_tree(head_tree).deltas]
 
 
 def check_gitignore():
@@ -43,8 +233,7 @@ def check_env_file():
         return True
     
     # Check if .env is in git
-    result = os.system('git ls-files .env 2>/dev/null')
-    if result == 0:
+    if _is_tracked('.env'):
         print("❌ CRITICAL: .env file is tracked by git!")
         print("   Run: git rm --cached .env")
         return False
@@ -53,47 +242,64 @@ def check_env_file():
     return True
 
 
+def _scan_file(filepath: str):
+    """
+    Scan a single file for hardcoded secrets.
+    
+    Returns:
+        Tuple of (issues, warning) where warning explains why the file was
+        skipped or could not be scanned, or is None if it was fully scanned
+    """
+    issues = []
+    
+    try:
+        with open(filepath, 'rb') as f:
+            # mmap rejects zero-length files
+            if os.fstat(f.fileno()).st_size == 0:
+                return issues, None
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                # Skip binary files misnamed as .py
+                if b'\0' in content[:BINARY_SNIFF_BYTES]:
+                    return issues, f"Skipped {filepath}: looks like a binary file"
+                
+                for start, description in _find_secrets(content):
+                    # Skip if it's a comment or example
+                    line_start = content.rfind(b'\n', 0, start) + 1
+                    line_end = content.find(b'\n', start)
+                    if line_end == -1:
+                        line_end = len(content)
+                    line = content[line_start:line_end].decode('utf-8', errors='replace').strip()
+                    
+                    if not line.startswith('#'):
+                        issues.append({
+                            'file': filepath,
+                            'description': description,
+                            'line': line[:80]
+                        })
+    
+    except Exception as e:
+        return issues, f"Could not scan {filepath}: {e}"
+    
+    return issues, None
+
+
 def check_for_secrets_in_code():
     """Scan Python files for potential hardcoded secrets."""
     print("\n🔍 Scanning for hardcoded secrets...")
     
-    patterns = [
-        (r'mongodb\+srv://[^<][^"\']+', 'MongoDB connection string'),
-        (r'password\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded password'),
-        (r'api[_-]?key\s*=\s*["\'][^"\']+["\']', 'API key'),
-        (r'secret\s*=\s*["\'][^"\']+["\']', 'Secret key'),
-    ]
-    
     issues_found = []
+    files = list(_iter_python_files('.'))
     
-    for root, dirs, files in os.walk('.'):
-        # Skip virtual environment and git directories
-        dirs[:] = [d for d in dirs if d not in ['venv', '.git', '__pycache__', '.ipynb_checkpoints']]
-        
-        for file in files:
-            if file.endswith('.py'):
-                filepath = os.path.join(root, file)
-                
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    for pattern, description in patterns:
-                        matches = re.finditer(pattern, content, re.IGNORECASE)
-                        for match in matches:
-                            # Skip if it's a comment or example
-                            line_start = content.rfind('\n', 0, match.start()) + 1
-                            line = content[line_start:content.find('\n', match.start())]
-                            
-                            if not line.strip().startswith('#'):
-                                issues_found.append({
-                                    'file': filepath,
-                                    'description': description,
-                                    'line': line.strip()[:80]
-                                })
-                
-                except Exception as e:
-                    print(f"⚠️  Could not scan {filepath}: {e}")
+    # Files are independent, but threads only run in parallel on the Hyperscan
+    # path, whose scan releases the GIL. The stdlib re fallback holds the GIL,
+    # so it gets a single worker.
+    workers = os.cpu_count() if _HYPERSCAN_DB is not None else 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for issues, warning in executor.map(_scan_file, files):
+            if warning is not None:
+                print(f"⚠️  {warning}")
+            issues_found.extend(issues)
     
     if issues_found:
         print(f"⚠️  Found {len(issues_found)} potential security issues:")
@@ -140,24 +346,16 @@ def check_git_status():
         return True
     
     # Get staged files
-    import subprocess
     try:
-        result = subprocess.run(
-            ['git', 'diff', '--cached', '--name-only'],
-            capture_output=True,
-            text=True
-        )
-        
-        staged_files = result.stdout.strip().split('\n')
+        staged_files = _staged_files()
         
         sensitive_patterns = ['.env', 'credentials', 'secrets', '.pem', '.key']
         sensitive_staged = []
         
         for file in staged_files:
-            if file:
-                for pattern in sensitive_patterns:
-                    if pattern in file.lower():
-                        sensitive_staged.append(file)
+            for pattern in sensitive_patterns:
+                if pattern in file.lower():
+                    sensitive_staged.append(file)
         
         if sensitive_staged:
             print(f"❌ Sensitive files staged for commit: {sensitive_staged}")
@@ -18,6 +18,8 @@ RAW_DATA_DIR = os.path.join(DATA_DIR, 'raw')
 PROCESSED_DATA_DIR = os.path.join(DATA_DIR, 'processed')
 VISUALIZATIONS_DIR = 'visualizations'
 
-# Create directories if they don't exist
-for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, VISUALIZATIONS_DIR]:
-    os.makedirs(directory, exist_ok=True)
+
+def ensure_dirs(dirs=(DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, VISUALIZATIONS_DIR)):
+    """Create data directories if they don't exist (call before writing data)."""
+    for directory in dirs:
+        os.makedirs(directory, exist_ok=True)
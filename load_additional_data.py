@@ -4,11 +4,26 @@ Script to load additional startup data from various sources.
 Supports CSV, JSON, and manual data entry.
 """
 import json
+import sys
 import pandas as pd
 from mongodb_setup import MongoDBHandler
+from utils import load_json_file, parse_json
 import config
 
 
+# Types for the known startup CSV columns (other columns are inferred)
+CSV_DTYPES = {
+    'name': 'string',
+    'country': 'string',
+    'city': 'string',
+    'industry': 'string',
+    'status': 'string',
+    'founded_year': 'Int32',
+    'employee_count': 'Int32',
+    'total_funding_usd': 'float64'
+}
+
+
 def load_from_csv(filepath: str):
     """
     Load startup data from CSV file.
@@ -18,15 +33,21 @@ def load_from_csv(filepath: str):
     """
     print(f"📥 Loading data from {filepath}...")
     
-    df = pd.read_csv(filepath)
+    df = pd.read_csv(filepath, dtype=CSV_DTYPES)
     
     # Convert industry string to list
     if 'industry' in df.columns:
-        df['industry'] = df['industry'].apply(
-            lambda x: [i.strip() for i in str(x).split(',')] if pd.notna(x) else []
+        industry = df['industry'].str.strip().str.split(r'\s*,\s*', regex=True)
+        df['industry'] = industry.where(
+            industry.notna(), pd.Series([[] for _ in range(len(df))], index=df.index, dtype=object)
         )
     
-    # Convert to list of dictionaries
+    # Missing funding counts as 0, same as manual entry
+    if 'total_funding_usd' in df.columns:
+        df['total_funding_usd'] = df['total_funding_usd'].fillna(0)
+    
+    # Convert to list of dictionaries (missing values become None for BSON)
+    df = df.astype(object).where(df.notna(), None)
     startups = df.to_dict('records')
     
     print(f"✅ Loaded {len(startups)} startups from CSV")
@@ -37,13 +58,60 @@ def load_from_json(filepath: str):
     """Load startup data from JSON file."""
     print(f"📥 Loading data from {filepath}...")
     
-    with open(filepath, 'r') as f:
-        startups = json.load(f)
+    startups = load_json_file(filepath)
     
     print(f"✅ Loaded {len(startups)} startups from JSON")
     return startups
 
 
+def load_from_stdin():
+    """
+    Load startup data piped to stdin as a single JSON blob.
+    
+    Accepts one startup object or an array of them; entries are normalized
+    the same way as manual entry.
+    """
+    print("📥 Loading data from stdin...")
+    
+    data = parse_json(sys.stdin.read())
+    entries = data if isinstance(data, list) else [data]
+    startups = [normalize_startup(entry) for entry in entries]
+    
+    print(f"✅ Loaded {len(startups)} startups from stdin")
+    return startups
+
+
+def normalize_startup(entry):
+    """
+    Coerce a startup entry to the same types manual entry produces.
+    
+    Raises:
+        ValueError: If the entry is not an object or has no name
+    """
+    if not isinstance(entry, dict):
+        raise ValueError(f"Expected a startup object, got {type(entry).__name__}")
+    if not entry.get('name'):
+        raise ValueError("Startup entry is missing 'name'")
+    
+    startup = dict(entry)
+    startup['name'] = str(startup['name']).strip()
+    
+    if startup.get('founded_year') not in (None, ''):
+        startup['founded_year'] = int(startup['founded_year'])
+    
+    # Industry (comma-separated string or list)
+    industries = startup.get('industry') or []
+    if isinstance(industries, str):
+        industries = [i.strip() for i in industries.split(',') if i.strip()]
+    startup['industry'] = industries
+    
+    startup['total_funding_usd'] = float(startup.get('total_funding_usd') or 0)
+    startup['employee_count'] = int(startup.get('employee_count') or 0)
+    startup['status'] = startup.get('status') or "Operating"
+    
+    return startup
+
+
 def create_startup_interactive():
     """Interactive CLI for creating a startup entry."""
     print("\n" + "="*60)
@@ -85,6 +153,8 @@ def main():
     print("📊 LOAD ADDITIONAL STARTUP DATA")
     print("="*60 + "\n")
     
+    config.ensure_dirs()
+    
     print("Choose data source:")
     print("1. CSV file")
     print("2. JSON file")
@@ -112,13 +182,21 @@ def main():
             return
     
     elif choice == '3':
-        while True:
-            startup = create_startup_interactive()
-            startups.append(startup)
-            
-            more = input("\nAdd another startup? (y/n): ").strip().lower()
-            if more != 'y':
-                break
+        if not sys.stdin.isatty():
+            # Piped input: all entries arrive in one JSON blob, no follow-up prompts
+            try:
+                startups = load_from_stdin()
+            except Exception as e:
+                print(f"❌ Error loading piped JSON: {e}")
+                return
+        else:
+            while True:
+                startup = create_startup_interactive()
+                startups.append(startup)
+                
+                more = input("\nAdd another startup? (y/n): ").strip().lower()
+                if more != 'y':
+                    break
     
     elif choice == '4':
         import os
@@ -2,10 +2,12 @@
 MongoDB Atlas connection and data insertion script.
 This module handles database connections, collection setup, and data ingestion.
 """
+import atexit
 import json
+from functools import lru_cache
 from typing import List, Dict, Any
-from pymongo import MongoClient, ASCENDING, DESCENDING
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
+from pymongo import MongoClient, IndexModel, ASCENDING, DESCENDING
+from pymongo.errors import ConnectionFailure, BulkWriteError
 import config
 
 
@@ -24,6 +26,7 @@ class MongoDBHandler:
         self.db_name = db_name or config.DATABASE_NAME
         self.client = None
         self.db = None
+        self._ready_collections = set()
         
     def connect(self):
         """Establish connection to MongoDB Atlas."""
@@ -54,28 +57,39 @@ class MongoDBHandler:
         """
         collection_name = collection_name or config.COLLECTION_NAME
         
-        if collection_name in self.db.list_collection_names():
-            print(f"ℹ️  Collection '{collection_name}' already exists.")
+        # Already set up by this handler, skip the server round-trip
+        if collection_name in self._ready_collections:
             return self.db[collection_name]
         
+        exists = collection_name in self.db.list_collection_names()
         collection = self.db[collection_name]
         
-        # Create indexes for better query performance
-        collection.create_index([("name", ASCENDING)], unique=True)
-        collection.create_index([("country", ASCENDING)])
-        collection.create_index([("industry", ASCENDING)])
-        collection.create_index([("founded_year", DESCENDING)])
+        # Create indexes for better query performance (single createIndexes command).
+        # This is idempotent, so existing collections also pick up newly added indexes.
+        collection.create_indexes([
+            IndexModel([("name", ASCENDING)], unique=True),
+            IndexModel([("country", ASCENDING)]),
+            IndexModel([("industry", ASCENDING)]),
+            IndexModel([("founded_year", DESCENDING)]),
+            IndexModel([("total_funding_usd", DESCENDING)])
+        ])
         
-        print(f"✅ Collection '{collection_name}' created with indexes.")
+        self._ready_collections.add(collection_name)
+        if exists:
+            print(f"ℹ️  Collection '{collection_name}' already exists, indexes verified.")
+        else:
+            print(f"✅ Collection '{collection_name}' created with indexes.")
         return collection
     
-    def insert_startups(self, startups: List[Dict[str, Any]], collection_name: str = None):
+    def insert_startups(self, startups: List[Dict[str, Any]], collection_name: str = None,
+                        verbose: bool = False):
         """
         Insert startup documents into the collection.
         
         Args:
             startups: List of startup documents
             collection_name: Target collection name
+            verbose: Also report the (estimated) total documents in the collection
             
         Returns:
             Number of successfully inserted documents
@@ -84,20 +98,34 @@ class MongoDBHandler:
         collection = self.db[collection_name]
         
         inserted_count = 0
-        duplicate_count = 0
         
-        for startup in startups:
+        # Drop names already in the collection with one query (scoped to this
+        # batch) instead of letting each one fail server-side as a duplicate key
+        existing_names = set()
+        if startups:
+            batch_names = [s.get('name') for s in startups]
+            existing_names = set(collection.distinct('name', {'name': {'$in': batch_names}}))
+        new_startups = [s for s in startups if s.get('name') not in existing_names]
+        duplicate_count = len(startups) - len(new_startups)
+        
+        if new_startups:
             try:
-                collection.insert_one(startup)
-                inserted_count += 1
-            except DuplicateKeyError:
-                duplicate_count += 1
-                print(f"⚠️  Duplicate entry skipped: {startup.get('name', 'Unknown')}")
+                # Unordered bulk insert: one round-trip, duplicates don't abort the batch
+                result = collection.insert_many(new_startups, ordered=False)
+                inserted_count = len(result.inserted_ids)
+            except BulkWriteError as e:
+                write_errors = e.details.get('writeErrors', [])
+                server_duplicates = sum(1 for err in write_errors if err.get('code') == 11000)
+                if server_duplicates != len(write_errors):
+                    raise
+                duplicate_count += server_duplicates
+                inserted_count = len(new_startups) - server_duplicates
         
         print(f"\n📊 Insertion Summary:")
         print(f"   ✅ Inserted: {inserted_count}")
         print(f"   ⚠️  Duplicates skipped: {duplicate_count}")
-        print(f"   📈 Total documents in collection: {collection.count_documents({})}")
+        if verbose:
+            print(f"   📈 Total documents in collection: {collection.estimated_document_count()}")
         
         return inserted_count
     
@@ -131,9 +159,28 @@ class MongoDBHandler:
         """
         collection_name = collection_name or config.COLLECTION_NAME
         self.db[collection_name].drop()
+        self._ready_collections.discard(collection_name)
         print(f"🗑️  Collection '{collection_name}' dropped.")
 
 
+@lru_cache(maxsize=1)
+def get_handler() -> MongoDBHandler:
+    """
+    Get a shared, connected MongoDB handler for this process.
+    
+    The connection is created on first use and closed automatically at exit.
+    
+    Raises:
+        ConnectionFailure: If the connection cannot be established
+    """
+    handler = MongoDBHandler()
+    if not handler.connect():
+        raise ConnectionFailure(f"Could not connect to {handler.db_name}")
+    
+    atexit.register(handler.close)
+    return handler
+
+
 def load_sample_data():
     """Load sample startup data for testing."""
     sample_startups = [
@@ -226,6 +273,8 @@ def main():
     """Main function to demonstrate MongoDB setup."""
     print("🚀 Starting MongoDB Atlas Setup...\n")
     
+    config.ensure_dirs()
+    
     # Initialize handler
     handler = MongoDBHandler()
     
@@ -4,8 +4,10 @@ Quick start script to verify setup and run basic analysis.
 """
 import os
 import sys
-from mongodb_setup import MongoDBHandler, load_sample_data
-from utils import calculate_funding_stats, format_currency
+from collections import Counter
+from pymongo.errors import ConnectionFailure
+from mongodb_setup import get_handler, load_sample_data
+from utils import format_currency, format_currency_array
 
 
 def check_environment():
@@ -36,23 +38,22 @@ def test_connection():
     """Test MongoDB connection."""
     print("🔌 Testing MongoDB connection...\n")
     
-    handler = MongoDBHandler()
-    if handler.connect():
-        print("✅ Successfully connected to MongoDB Atlas!\n")
-        handler.close()
-        return True
-    else:
+    try:
+        get_handler()
+    except ConnectionFailure:
         print("❌ Failed to connect to MongoDB")
         print("   Please check your connection string and network access")
         return False
+    
+    print("✅ Successfully connected to MongoDB Atlas!\n")
+    return True
 
 
 def setup_database():
     """Initialize database with sample data."""
     print("📊 Setting up database...\n")
     
-    handler = MongoDBHandler()
-    handler.connect()
+    handler = get_handler()
     
     # Create collection
     handler.create_collection()
@@ -67,7 +68,6 @@ def setup_database():
     stats = handler.get_collection_stats()
     print(f"\n📈 Database ready with {stats['total_documents']} startups")
     
-    handler.close()
     return True
 
 
@@ -77,49 +77,57 @@ def run_sample_analysis():
     print("📊 SAMPLE ANALYSIS")
     print("="*60 + "\n")
     
-    handler = MongoDBHandler()
-    handler.connect()
+    handler = get_handler()
     
     collection = handler.db['startups']
     
-    # Get all startups
-    startups = list(collection.find({}, {'_id': 0}))
-    
-    if not startups:
+    # Compute funding stats server-side so only one summary document is returned.
+    # Missing or null funding counts as 0, as in calculate_funding_stats.
+    funding = {"$ifNull": ["$total_funding_usd", 0]}
+    summary = next(collection.aggregate([
+        {"$group": {
+            "_id": None,
+            "total": {"$sum": funding},
+            "avg": {"$avg": funding},
+            "max": {"$max": funding},
+            "min": {"$min": funding},
+            "count": {"$sum": 1}
+        }}
+    ]), None)
+    
+    if not summary:
         print("⚠️  No data found. Run setup first.")
-        handler.close()
         return
     
-    # Calculate stats
-    stats = calculate_funding_stats(startups)
-    
-    print(f"🏢 Total Startups: {len(startups)}")
-    print(f"💰 Total Funding: {format_currency(stats['total'])}")
-    print(f"📈 Average Funding: {format_currency(stats['average'])}")
-    print(f"🎯 Max Funding: {format_currency(stats['max'])}")
-    print(f"📉 Min Funding: {format_currency(stats['min'])}")
+    print(f"🏢 Total Startups: {summary['count']}")
+    print(f"💰 Total Funding: {format_currency(summary['total'])}")
+    print(f"📈 Average Funding: {format_currency(summary['avg'])}")
+    print(f"🎯 Max Funding: {format_currency(summary['max'])}")
+    print(f"📉 Min Funding: {format_currency(summary['min'])}")
     
     # Top 3 funded startups
     print("\n🏆 Top 3 Most Funded Startups:")
-    top_startups = sorted(startups, key=lambda x: x.get('total_funding_usd', 0), reverse=True)[:3]
+    top_startups = list(collection.find(
+        {}, {"_id": 0, "name": 1, "country": 1, "total_funding_usd": 1}
+    ).sort("total_funding_usd", -1).limit(3))
+    fundings = format_currency_array([s.get('total_funding_usd') or 0 for s in top_startups])
     
-    for i, startup in enumerate(top_startups, 1):
-        funding = format_currency(startup.get('total_funding_usd', 0))
+    for i, (startup, funding) in enumerate(zip(top_startups, fundings), 1):
         print(f"   {i}. {startup['name']} ({startup['country']}) - {funding}")
     
     # Countries
-    countries = {}
-    for startup in startups:
-        country = startup.get('country', 'Unknown')
-        countries[country] = countries.get(country, 0) + 1
+    countries = Counter({
+        entry['_id']: entry['count']
+        for entry in collection.aggregate([
+            {"$group": {"_id": {"$ifNull": ["$country", "Unknown"]}, "count": {"$sum": 1}}}
+        ])
+    })
     
     print(f"\n🌍 Countries Represented: {len(countries)}")
-    for country, count in sorted(countries.items(), key=lambda x: x[1], reverse=True):
+    for country, count in countries.most_common():
         print(f"   {country}: {count} startup{'s' if count > 1 else ''}")
     
     print("\n" + "="*60)
-    
-    handler.close()
 
 
 def main():
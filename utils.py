@@ -2,40 +2,78 @@
 Utility functions for data processing and analysis.
 """
 import json
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_json_file(filepath: str) -> List[Dict[str, Any]]:
     """Load data from JSON file."""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    
     with open(filepath, 'r') as f:
         return json.load(f)
 
 
+def parse_json(data):
+    """Parse JSON from a string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def save_json_file(data: List[Dict[str, Any]], filepath: str):
     """Save data to JSON file."""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
     with open(filepath, 'w') as f:
         json.dump(data, f, indent=2)
 
 
 def calculate_funding_stats(startups: List[Dict[str, Any]]) -> Dict[str, float]:
     """Calculate funding statistics."""
-    fundings = [s.get('total_funding_usd', 0) for s in startups]
+    fundings = np.fromiter(
+        (s.get('total_funding_usd') or 0 for s in startups),
+        dtype=np.float64,
+        count=len(startups)
+    )
+    if not fundings.size:
+        return {'total': 0.0, 'average': 0.0, 'max': 0.0, 'min': 0.0}
+    
     return {
-        'total': sum(fundings),
-        'average': sum(fundings) / len(fundings) if fundings else 0,
-        'max': max(fundings) if fundings else 0,
-        'min': min(fundings) if fundings else 0
+        'total': float(fundings.sum()),
+        'average': float(fundings.mean()),
+        'max': float(fundings.max()),
+        'min': float(fundings.min())
     }
 
 
+# Currency scales, largest first
+_SCALES = [(1_000_000_000, 'B'), (1_000_000, 'M'), (1_000, 'K')]
+
+
 def format_currency(amount: float) -> str:
     """Format number as currency."""
-    if amount >= 1_000_000_000:
-        return f"${amount/1_000_000_000:.2f}B"
-    elif amount >= 1_000_000:
-        return f"${amount/1_000_000:.2f}M"
-    elif amount >= 1_000:
-        return f"${amount/1_000:.2f}K"
-    else:
-        return f"${amount:.2f}"
+    for divisor, suffix in _SCALES:
+        if amount >= divisor:
+            return f"${amount/divisor:.2f}{suffix}"
+    return f"${amount:.2f}"
+
+
+def format_currency_array(amounts) -> List[str]:
+    """Format many numbers as currency, scaling them in one vectorized pass."""
+    values = np.asarray(amounts, dtype=np.float64)
+    conditions = [values >= divisor for divisor, _ in _SCALES]
+    scaled = np.select(conditions, [values / divisor for divisor, _ in _SCALES], default=values)
+    suffixes = np.select(conditions, [suffix for _, suffix in _SCALES], default='')
+    return [f"${value:.2f}{suffix}" for value, suffix in zip(scaled, suffixes)]